@@ -1,40 +1,32 @@
 from typing import Union
 
+from . import classical_converter as barnabodha
 from . import internal_utils as util
-from .constants import DASHAMIK, NUM_DATA, UNITS
+from . import word_engine
+from .constants import NUM_WORDS, UNITS
 
+_words_int = word_engine.build_int_converter(UNITS)
 
-def _format_compound_number(
-    number: int,
-    divisor: int,
-    unit_label: str,
-    as_roman: bool,
-    as_odilish: bool,
-) -> str:
-    """
-    Format large numbers recursively using Indian denominations
-    such as thousand, lakh, and crore.
 
-    Args:
-        number (int): Full numeric value
-        divisor (int): Denomination divisor
-        unit_label (str): Unit name in selected script
-        as_roman (bool): Romanized Odia flag
-        as_odilish (bool): Odilish flag
+def _words_decimal(num_str: str, index: int) -> str:
+    """Convert an already validated decimal string to Odia words."""
+    return word_engine.decimal_to_words(num_str, index, _words_int)
 
-    Returns:
-        str: Formatted Odia number in words
-    """
-    quotient = number // divisor
-    remainder = number % divisor
 
-    prefix = to_odia_words(quotient, as_roman=as_roman, as_odilish=as_odilish)
+def _words(num_str: str, index: int) -> str:
+    """
+    Convert an already validated numeric string for a resolved
+    language index. Public entry points resolve the index once and
+    hand off here, so the conversion path never sees the flags.
+    """
+    if "." in num_str:
+        return _words_decimal(num_str, index)
 
-    if remainder == 0:
-        return f"{prefix} {unit_label}"
+    value = int(num_str)
+    if value <= 100:
+        return NUM_WORDS[index][value]
 
-    suffix = to_odia_words(remainder, as_roman=as_roman, as_odilish=as_odilish)
-    return f"{prefix} {unit_label} {suffix}"
+    return _words_int(value, index)
 
 
 def to_odia_words(
@@ -65,54 +57,17 @@ def to_odia_words(
     """
     num_str = util._validate_and_format(number)
     index = util._resolve_language_index(as_roman, as_odilish)
-
-    if "." in num_str:
-        integer_part, fractional_part = num_str.split(".")
-        integer_words = to_odia_words(
-            int(integer_part), as_roman=as_roman, as_odilish=as_odilish
-        )
-        decimal_word = DASHAMIK[index]
-        fractional_words = [NUM_DATA[int(digit)][index] for digit in fractional_part]
-        return f"{integer_words} {decimal_word} {' '.join(fractional_words)}"
-
-    value = int(num_str)
-    if value <= 100:
-        return NUM_DATA[value][index]
-
-    for unit in (10_000_000, 100_000, 1_000):
-        if value >= unit:
-            return _format_compound_number(
-                value,
-                unit,
-                UNITS[unit][index],
-                as_roman,
-                as_odilish,
-            )
-
-    hundreds = value // 100
-    remainder = value % 100
-
-    if remainder == 0 and hundreds == 1:
-        return NUM_DATA[100][index]
-
-    prefix = to_odia_words(hundreds, as_roman=as_roman, as_odilish=as_odilish)
-    suffix = (
-        to_odia_words(remainder, as_roman=as_roman, as_odilish=as_odilish)
-        if remainder
-        else ""
-    )
-
-    return f"{prefix} {UNITS[100][index]} {suffix}".strip()
+    return _words(num_str, index)
 
 
 def to_roman_words(number: Union[str, int, float]) -> str:
     """Return Romanized Odia number words."""
-    return to_odia_words(number, as_roman=True)
+    return _words(util._validate_and_format(number), 1)
 
 
 def to_odilish_words(number: Union[str, int, float]) -> str:
     """Return Odilish-style Odia number words."""
-    return to_odia_words(number, as_odilish=True)
+    return _words(util._validate_and_format(number), 2)
 
 
 def to_barnabodha_words(
@@ -121,8 +76,6 @@ def to_barnabodha_words(
     as_odilish: bool = False,
 ) -> str:
     """Delegate conversion to the classical Barnabodha system."""
-    import classical_converter as barnabodha
-
-    return barnabodha.to_odia_barnabodha_words(
-        number, as_roman=as_roman, as_odilish=as_odilish
-    )
+    num_str = util._validate_and_format(number)
+    index = util._resolve_language_index(as_roman, as_odilish)
+    return barnabodha._barnabodha_words(num_str, index)
@@ -1,9 +1,26 @@
 from typing import Union
 
 from . import internal_utils as util
-from .constants import BARNABODHA_UNITS, DASHAMIK, NUM_DATA
+from . import word_engine
+from .constants import BARNABODHA_UNITS
 
-_SORTED_BARNABODHA_KEYS = sorted(BARNABODHA_UNITS.keys(), reverse=True)
+_barnabodha_words_int = word_engine.build_int_converter(BARNABODHA_UNITS)
+
+
+def _barnabodha_words_decimal(num_str: str, index: int) -> str:
+    """Convert an already validated decimal string to Barnabodha words."""
+    return word_engine.decimal_to_words(num_str, index, _barnabodha_words_int)
+
+
+def _barnabodha_words(num_str: str, index: int) -> str:
+    """
+    Convert an already validated numeric string to Barnabodha words
+    for a resolved language index.
+    """
+    if "." in num_str:
+        return _barnabodha_words_decimal(num_str, index)
+
+    return _barnabodha_words_int(int(num_str), index)
 
 
 def to_odia_barnabodha_words(
@@ -33,56 +50,18 @@ def to_odia_barnabodha_words(
     """
     num_str = util._validate_and_format(number)
     index = util._resolve_language_index(as_roman, as_odilish)
-
-    if "." in num_str:
-        integer_part, fractional_part = num_str.split(".")
-        integer_words = to_odia_barnabodha_words(
-            int(integer_part),
-            as_roman=as_roman,
-            as_odilish=as_odilish,
-        )
-        decimal_label = DASHAMIK[index]
-        fractional_words = [NUM_DATA[int(digit)][index] for digit in fractional_part]
-        return f"{integer_words} {decimal_label} {' '.join(fractional_words)}"
-
-    value = int(num_str)
-    if value <= 100:
-        return NUM_DATA[value][index]
-
-    for unit_value in _SORTED_BARNABODHA_KEYS:
-        if value >= unit_value:
-            quotient = value // unit_value
-            remainder = value % unit_value
-            unit_label = BARNABODHA_UNITS[unit_value][index]
-            prefix = to_odia_barnabodha_words(
-                quotient,
-                as_roman=as_roman,
-                as_odilish=as_odilish,
-            )
-
-            if remainder == 0:
-                return f"{prefix} {unit_label}"
-
-            suffix = to_odia_barnabodha_words(
-                remainder,
-                as_roman=as_roman,
-                as_odilish=as_odilish,
-            )
-            return f"{prefix} {unit_label} {suffix}"
-
-    return NUM_DATA[value][index]
+    return _barnabodha_words(num_str, index)
 
 
 def to_roman_words(number: Union[str, int, float]) -> str:
     """
     Return Romanized Odia words using the Barnabodha system.
     """
-    return to_odia_barnabodha_words(number, as_roman=True)
+    return _barnabodha_words(util._validate_and_format(number), 1)
 
 
 def to_odilish_words(number: Union[str, int, float]) -> str:
     """
     Return Odilish (English-script Odia) words using the Barnabodha system.
     """
-    return to_odia_barnabodha_words(number, as_odilish=True)
-    return to_odia_barnabodha_words(number, as_odilish=True)
+    return _barnabodha_words(util._validate_and_format(number), 2)
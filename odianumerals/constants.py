@@ -40,6 +40,8 @@ Sources
 Compiled & curated by: Srinibash Samal
 """
 
+import sys
+
 # ---------------------------------------------------------------------
 # Odia Digit Symbols (0–9)
 # ---------------------------------------------------------------------
@@ -60,6 +62,10 @@ ODIA_DIGITS = {
 # Reverse mapping: Odia digit → English digit
 ENG_DIGITS = {odia: eng for eng, odia in ODIA_DIGITS.items()}
 
+# str.translate tables for whole-string digit conversion
+ODIA_DIGIT_TRANS = str.maketrans(ODIA_DIGITS)
+ENG_DIGIT_TRANS = str.maketrans(ENG_DIGITS)
+
 # ---------------------------------------------------------------------
 # Odia Cardinal Numbers (0–100)
 # Format:
@@ -169,6 +175,7 @@ NUM_DATA = {
     99: ("ଅନେଶୋତ", "aneśota", "aneshata"),
     100: ("ଶହେ", "śahe", "shahe"),
 }
+
 # ---------------------------------------------------------------------
 # Common Large Number Units (Modern Usage)
 # ---------------------------------------------------------------------
@@ -212,6 +219,7 @@ BARNABODHA_UNITS = {
 
 
 ENG_NUMBER_WORDS = {
+    0: "zero",
     1: "one",
     2: "two",
     3: "three",
@@ -465,3 +473,29 @@ MATH_VERBS = {
     "/": ("ହରିଲେ", "harile", "harile"),
     "÷": ("ହରିଲେ", "harile", "harile"),
 }
+
+
+# ---------------------------------------------------------------------
+# Interned Word Tokens
+# ---------------------------------------------------------------------
+# Converter output is assembled from this small, closed set of words.
+# Interning them means every converter shares a single object per word.
+
+
+def _intern_tuple(values: tuple) -> tuple:
+    return tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+
+
+NUM_DATA = {num: _intern_tuple(words) for num, words in NUM_DATA.items()}
+UNITS = {unit: _intern_tuple(words) for unit, words in UNITS.items()}
+BARNABODHA_UNITS = {
+    unit: _intern_tuple(words) for unit, words in BARNABODHA_UNITS.items()
+}
+DASHAMIK = _intern_tuple(DASHAMIK)
+
+# ---------------------------------------------------------------------
+# Derived Lookup Tables
+# ---------------------------------------------------------------------
+
+# Flattened view of NUM_DATA: NUM_WORDS[index][number] for 0–100
+NUM_WORDS = tuple(tuple(NUM_DATA[num][idx] for num in range(101)) for idx in range(3))
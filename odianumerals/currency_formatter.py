@@ -1,10 +1,12 @@
+from functools import lru_cache
 from typing import Union
 
+from . import cardinal_converter as cardinal
 from . import classical_converter as barnabodha
 from . import internal_utils as util
-from .cardinal_converter import to_odia_words
 
 
+@lru_cache(maxsize=1024)
 def to_odia_currency(
     number: Union[str, int, float],
     barnabodha_style: bool = False,
@@ -35,30 +37,21 @@ def to_odia_currency(
     tanka_label = ("ଟଙ୍କା", "ṭaṅkā", "tanka")[index]
     paisa_label = ("ପଇସା", "paisa", "paisa")[index]
 
-    if "." in num_str:
-        tanka_part, paisa_raw = num_str.split(".")
-        paisa_value = int((paisa_raw + "0")[:2])
-    else:
-        tanka_part, paisa_value = num_str, 0
-
+    tanka_part, has_paisa, paisa_raw = num_str.partition(".")
     tanka_value = int(tanka_part)
+    paisa_value = int((paisa_raw + "0")[:2]) if has_paisa else 0
 
+    # Amounts are already parsed ints, so use the int-only converters
     converter = (
-        barnabodha.to_odia_barnabodha_words if barnabodha_style else to_odia_words
+        barnabodha._barnabodha_words_int if barnabodha_style else cardinal._words_int
     )
 
-    tanka_words = converter(tanka_value, as_roman=as_roman, as_odilish=as_odilish)
-    paisa_words = (
-        converter(paisa_value, as_roman=as_roman, as_odilish=as_odilish)
-        if paisa_value > 0
-        else ""
-    )
+    if paisa_value == 0:
+        return converter(tanka_value, index) + " " + tanka_label
 
-    if tanka_value == 0 and paisa_value == 0:
-        return f"{tanka_words} {tanka_label}"
-    if tanka_value == 0 and paisa_value > 0:
-        return f"{paisa_words} {paisa_label}"
-    if paisa_value > 0 and paisa_value == 0:
-        return f"{tanka_words} {tanka_label}"
+    paisa_words = converter(paisa_value, index)
+    if tanka_value == 0:
+        return paisa_words + " " + paisa_label
 
-    return f"{tanka_words} {tanka_label} {paisa_words} {paisa_label}"
+    tanka_words = converter(tanka_value, index)
+    return " ".join((tanka_words, tanka_label, paisa_words, paisa_label))
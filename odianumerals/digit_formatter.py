@@ -1,9 +1,16 @@
+import re
+from functools import lru_cache
 from typing import Union
 
-from .constants import ENG_DIGITS, ODIA_DIGITS
+from .constants import ENG_DIGIT_TRANS, ODIA_DIGIT_TRANS
 from .internal_utils import _validate_and_format
 
+# Comma positions for Indian grouping: before the last three digits,
+# then before every further pair (e.g. 12,34,567)
+_INDIAN_GROUPING = re.compile(r"(?<=\d)(?=(?:\d\d)*\d\d\d$)")
 
+
+@lru_cache(maxsize=1024)
 def to_odia_digits(number: Union[str, int, float]) -> str:
     """
     Convert English digits into Odia digit symbols.
@@ -18,8 +25,7 @@ def to_odia_digits(number: Union[str, int, float]) -> str:
     Returns:
         str: Odia digit string
     """
-    num_str = _validate_and_format(number)
-    return "".join(ODIA_DIGITS.get(ch, ch) for ch in num_str)
+    return _validate_and_format(number).translate(ODIA_DIGIT_TRANS)
 
 
 def to_english_number(number_str: str) -> Union[int, float]:
@@ -36,7 +42,7 @@ def to_english_number(number_str: str) -> Union[int, float]:
         ValueError: If conversion fails
     """
     clean_value = str(number_str).replace(",", "")
-    english_value = "".join(ENG_DIGITS.get(ch, ch) for ch in clean_value)
+    english_value = clean_value.translate(ENG_DIGIT_TRANS)
 
     try:
         return float(english_value) if "." in english_value else int(english_value)
@@ -44,6 +50,7 @@ def to_english_number(number_str: str) -> Union[int, float]:
         raise ValueError(f"Unable to convert '{number_str}' to a numeric value.")
 
 
+@lru_cache(maxsize=1024)
 def format_indian_style(
     number: Union[str, int, float], use_odia_digits: bool = False
 ) -> str:
@@ -67,19 +74,11 @@ def format_indian_style(
     else:
         integer_part, fractional_part = num_str, ""
 
-    if len(integer_part) <= 3:
-        formatted = integer_part
-    else:
-        last_three = integer_part[-3:]
-        remaining = integer_part[:-3]
-        groups = [remaining[max(i - 2, 0) : i] for i in range(len(remaining), 0, -2)][
-            ::-1
-        ]
-        formatted = ",".join(groups + [last_three])
+    formatted = _INDIAN_GROUPING.sub(",", integer_part)
 
     result = f"{formatted}.{fractional_part}" if fractional_part else formatted
 
     if use_odia_digits:
-        return "".join(ODIA_DIGITS.get(ch, ch) for ch in result)
+        return result.translate(ODIA_DIGIT_TRANS)
 
     return result
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 from . import internal_utils as utils
@@ -5,53 +6,74 @@ from . import internal_utils as utils
 # from .constants import ENG_NUMBER_WORDS, ENG_ORDINAL_WORDS, LARGE_ENG_NUMBER_WORDS
 from .constants import ENG_NUMBER_WORDS, LARGE_ENG_NUMBER_WORDS
 
-_SORTED_LARGE_NUMBER = sorted(LARGE_ENG_NUMBER_WORDS.keys(), reverse=True)
+# (unit_value, unit_name) pairs, largest first
+_LARGE_UNITS = tuple(sorted(LARGE_ENG_NUMBER_WORDS.items(), reverse=True))
 
+# Words for digits 0-9, indexed by ord(digit) - 48
+_DIGIT_WORDS = tuple(ENG_NUMBER_WORDS[digit] for digit in range(10))
 
-def integer_to_words(num: int) -> str:
-    """Converts an integer to English words using the Indian system."""
-    if num == 0:
-        return ENG_NUMBER_WORDS[0]
+# Words for 0-99, with compound tens joined by a hyphen (e.g. "twenty-three")
+_SUB_100_WORDS = tuple(
+    ENG_NUMBER_WORDS.get(value)
+    or ENG_NUMBER_WORDS[value // 10 * 10] + "-" + ENG_NUMBER_WORDS[value % 10]
+    for value in range(100)
+)
+
+
+def _append_words(num: int, out: list) -> None:
+    """
+    Append the English word tokens of a positive integer to ``out``.
+    Unit counts are expanded into the same list, so nested
+    denominations never build and re-join intermediate strings.
+    """
+    append = out.append
+    if 0 <= num < 100:
+        append(_SUB_100_WORDS[num])
+        return
 
-    words = []
     remaining_number = num
 
-    for unit_value in _SORTED_LARGE_NUMBER:
+    for unit_value, unit_name in _LARGE_UNITS:
         if remaining_number >= unit_value:
-            unit_count = remaining_number // unit_value
-            remaining_number %= unit_value
-
-            unit_count_words = integer_to_words(unit_count)
-            unit_name = LARGE_ENG_NUMBER_WORDS[unit_value]
+            unit_count, remaining_number = divmod(remaining_number, unit_value)
 
-            words.append(f"{unit_count_words} {unit_name}")
+            _append_words(unit_count, out)
+            append(unit_name)
 
     if remaining_number >= 100:
-        hundreds_count = remaining_number // 100
-        remaining_number %= 100
+        hundreds_count, remaining_number = divmod(remaining_number, 100)
 
-        words.append(f"{ENG_NUMBER_WORDS[hundreds_count]} hundred")
+        append(ENG_NUMBER_WORDS[hundreds_count])
+        append("hundred")
 
     if remaining_number > 0:
-        if remaining_number in ENG_NUMBER_WORDS:
-            words.append(ENG_NUMBER_WORDS[remaining_number])
-        else:
-            tens_value = (remaining_number // 10) * 10
-            ones_value = remaining_number % 10
+        append(_SUB_100_WORDS[remaining_number])
+
 
-            words.append(
-                f"{ENG_NUMBER_WORDS[tens_value]}-{ENG_NUMBER_WORDS[ones_value]}"
-            )
+@lru_cache(maxsize=4096)
+def integer_to_words(num: int) -> str:
+    """Converts an integer to English words using the Indian system."""
+    if num < 0:
+        raise ValueError("Negative numbers are not supported.")
+    if type(num) is not int:
+        if num != int(num):
+            raise ValueError(f"Expected a whole number, got {num!r}")
+        num = int(num)
+    if num < 100:
+        return _SUB_100_WORDS[num]
 
+    words = []
+    _append_words(num, words)
     return " ".join(words)
 
 
+@lru_cache(maxsize=1024)
 def decimal_digits_to_words(decimal_part: str) -> str:
     """
     Converts decimal digits into word form.
     Example: "98" -> "nine eight"
     """
-    return " ".join(ENG_NUMBER_WORDS[int(digit)] for digit in decimal_part)
+    return " ".join([_DIGIT_WORDS[ord(digit) - 48] for digit in decimal_part])
 
 
 def number_to_words(value: Union[int, float, str]) -> str:
@@ -1,5 +1,24 @@
+import math
+import re
 from typing import Any, Union
 
+# Non-negative numeric strings already in normalized form (no leading
+# zeros, at most 10 decimals) that can skip the float round-trip. Lengths
+# are capped so float64 would reproduce them exactly: at most 15 integer
+# digits, or 5 integer digits when there are decimals to print.
+_PLAIN_NUMBER_RE = re.compile(
+    r"0|[1-9][0-9]{0,14}|(?:0|[1-9][0-9]{0,4})\.[0-9]{1,10}"
+)
+
+# Largest int the fast path returns verbatim. Beyond 2**53 float64 stops
+# being exact, so bigger ints (like longer strings above) take the generic
+# path and keep its float rounding whatever the input type.
+_MAX_EXACT_INT = 2**53
+
+# digit_formatter.to_english_number, bound on first use because
+# digit_formatter imports this module at load time
+_to_english_number = None
+
 
 def _to_english_numeric(val: Any) -> Any:
     """
@@ -7,11 +26,12 @@ def _to_english_numeric(val: Any) -> Any:
     to an English int or float. If it's not a numeric string,
     returns the value as-is.
     """
+    global _to_english_number
     if isinstance(val, str):
+        if _to_english_number is None:
+            from .digit_formatter import to_english_number as _to_english_number
         try:
-            from . import digit_formatter
-
-            return digit_formatter.to_english_number(val)
+            return _to_english_number(val)
         except (ValueError, TypeError):
             return val
     return val
@@ -33,11 +53,7 @@ def _resolve_language_index(as_roman: bool, as_odilish: bool) -> int:
     Returns:
         int: Corresponding data index
     """
-    if as_odilish:
-        return 2
-    if as_roman:
-        return 1
-    return 0
+    return 2 if as_odilish else (1 if as_roman else 0)
 
 
 def _validate_and_format(number: Union[str, int, float]) -> str:
@@ -58,6 +74,18 @@ def _validate_and_format(number: Union[str, int, float]) -> str:
         TypeError: If input is not numeric
         ValueError: If the number is negative
     """
+    number_type = type(number)
+    if number_type is int and 0 <= number <= _MAX_EXACT_INT:
+        return str(number)
+    if number_type is float and 0.0 <= number < math.inf:
+        if number.is_integer():
+            return str(int(number))
+        return format(number, ".10f").rstrip("0").rstrip(".")
+    if number_type is str and _PLAIN_NUMBER_RE.fullmatch(number):
+        if "." not in number:
+            return number
+        return number.rstrip("0").rstrip(".")
+
     try:
         num_float = float(number)
         if num_float < 0:
@@ -1,3 +1,4 @@
+import operator as _op
 import re
 from typing import Union
 
@@ -5,6 +6,19 @@ from . import cardinal_converter as cardinal
 from . import internal_utils as util
 from .constants import MATH_EQUALS, MATH_OPERATORS, MATH_VERBS
 
+# "Number Operator Number" in English or Odia digits
+_EXPR_ENG_RE = re.compile(r"(\d+\.?\d*)\s*([\+\-\*\/x])\s*(\d+\.?\d*)")
+_EXPR_ODIA_RE = re.compile(r"([୦-୯]+\.?[୦-୯]*)\s*([\+\-\*\/x])\s*([୦-୯]+\.?[୦-୯]*)")
+
+_OPS = {
+    "+": _op.add,
+    "-": _op.sub,
+    "*": _op.mul,
+    "x": _op.mul,
+    "/": _op.truediv,
+    "÷": _op.truediv,
+}
+
 
 def calculate_and_express(
     val_1: Union[str, int, float],
@@ -30,18 +44,12 @@ def calculate_and_express(
     num_1 = util._to_english_numeric(val_1)
     num_2 = util._to_english_numeric(val2)
 
-    if operator == "+":
-        result = num_1 + num_2
-    elif operator == "-":
-        result = num_1 - num_2
-    elif operator in ("*", "x"):
-        result = num_1 * num_2
-    elif operator in ("/", "÷"):
-        if num_2 == 0:
-            raise ZeroDivisionError("Cannot divide by zero in Odia math logic.")
-        result = num_1 / num_2
-    else:
+    try:
+        result = _OPS[operator](num_1, num_2)
+    except KeyError:
         raise ValueError(f"Unsupported operator: {operator}")
+    except ZeroDivisionError:
+        raise ZeroDivisionError("Cannot divide by zero in Odia math logic.")
 
     word_1 = cardinal.to_odia_words(num_1, as_roman, as_odilish)
     word_2 = cardinal.to_odia_words(num_2, as_roman, as_odilish)
@@ -59,11 +67,8 @@ def solve_expression(expression: str, **kwargs) -> str:
     """
 
     # Match number, operator, number
-    match = re.match(r"(\d+\.?\d*)\s*([\+\-\*\/x])\s*(\d+\.?\d*)", expression.strip())
-    if not match:
-        match = re.match(
-            r"([୦-୯]+\.?[୦-୯]*)\s*([\+\-\*\/x])\s*([୦-୯]+\.?[୦-୯]*)", expression.strip()
-        )
+    expression = expression.strip()
+    match = _EXPR_ENG_RE.match(expression) or _EXPR_ODIA_RE.match(expression)
 
     if not match:
         raise ValueError(
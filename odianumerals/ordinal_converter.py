@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Union
 
 from . import cardinal_converter as cardinal
@@ -15,6 +16,42 @@ from .constants import (
     ORDINAL_SUFFIX,
 )
 
+_ENGLISH_ORDINAL_SUFFIXES = ("st", "nd", "rd", "th")
+
+# English ordinal words for 1-99 (index 0 unused), e.g. 23 -> "twenty-third"
+_ORD_WORDS_SUB_100 = (None,) + tuple(
+    ENG_ORDINAL_WORDS.get(value)
+    or ENG_NUMBER_WORDS[value // 10 * 10] + "-" + ENG_ORDINAL_WORDS[value % 10]
+    for value in range(1, 100)
+)
+_ODIA_ORDINAL_RE = re.compile(r"^([୦-୯,.]+)\s*([ମୟର୍ଥଷ୍ଠଶ]*)$")
+
+
+@lru_cache(maxsize=2048)
+def _odia_ordinal_numeral_int(val: int) -> str:
+    """Build the Odia numeric ordinal (digits plus suffix) for an integer."""
+    if 11 <= val <= 18:
+        suffix = ORDINAL_NUMERIC_TEENS_SUFFIX
+    else:
+        last_digit = val % 10
+        suffix = ORDINAL_NUMERIC_SUFFIXES.get(
+            val, ORDINAL_NUMERIC_SUFFIXES.get(last_digit, ORDINAL_NUMERIC_DEFAULT)
+        )
+
+    return digit_formatter.to_odia_digits(val) + suffix
+
+
+@lru_cache(maxsize=2048)
+def _english_ordinal_numeral_int(val: int) -> str:
+    """Build the English numeric ordinal (e.g. 1st, 12th) for an integer."""
+    if 11 <= (val % 100) <= 13:
+        suffix = "th"
+    else:
+        last_digit = val % 10
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(last_digit, "th")
+
+    return str(val) + suffix
+
 
 def to_odia_ordinal_numeral(number: Union[str, int, float]) -> str:
     """
@@ -26,23 +63,17 @@ def to_odia_ordinal_numeral(number: Union[str, int, float]) -> str:
         11     -> ୧୧ଶ
     """
     if isinstance(number, str):
-        number = re.sub(r"(st|nd|rd|th)$", "", number, flags=re.IGNORECASE)
+        # Like the old "$" regex anchor, allow one trailing newline
+        stem = number[:-1] if number[-1:] == "\n" else number
+        if stem.lower().endswith(_ENGLISH_ORDINAL_SUFFIXES):
+            number = stem[:-2]
 
     try:
         val = int(util._to_english_numeric(number))
     except (ValueError, TypeError):
         raise ValueError(f"Invalid input for Odia ordinal numeral: {number}")
 
-    if 11 <= val <= 18:
-        suffix = ORDINAL_NUMERIC_TEENS_SUFFIX
-    else:
-        last_digit = val % 10
-        suffix = ORDINAL_NUMERIC_SUFFIXES.get(
-            val, ORDINAL_NUMERIC_SUFFIXES.get(last_digit, ORDINAL_NUMERIC_DEFAULT)
-        )
-
-    odia_number = digit_formatter.to_odia_digits(val)
-    return f"{odia_number}{suffix}"
+    return _odia_ordinal_numeral_int(val)
 
 
 def to_english_ordinal_numeral(odia_ordinal: str) -> str:
@@ -56,7 +87,7 @@ def to_english_ordinal_numeral(odia_ordinal: str) -> str:
     if not isinstance(odia_ordinal, str):
         raise ValueError("Input must be an Odia ordinal string (e.g., '୧ମ')")
 
-    match = re.match(r"^([୦-୯,.]+)\s*([ମୟର୍ଥଷ୍ଠଶ]*)$", odia_ordinal.strip())
+    match = _ODIA_ORDINAL_RE.match(odia_ordinal.strip())
 
     if not match:
         raise ValueError(f"Could not parse Odia ordinal: {odia_ordinal}")
@@ -68,13 +99,7 @@ def to_english_ordinal_numeral(odia_ordinal: str) -> str:
     except (ValueError, TypeError):
         raise ValueError(f"Invalid Odia digits in ordinal: {odia_digits_part}")
 
-    if 11 <= (val % 100) <= 13:
-        suffix = "th"
-    else:
-        last_digit = val % 10
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(last_digit, "th")
-
-    return f"{val}{suffix}"
+    return _english_ordinal_numeral_int(val)
 
 
 def to_ordinal_numeral(value: Union[str, int, float], lang: str) -> str:
@@ -128,7 +153,28 @@ def to_odia_ordinal_words(
         val, as_roman=as_roman, as_odilish=as_odilish
     )
     suffix = ORDINAL_SUFFIX[index]
-    return f"{base_cardinal}{suffix}"
+    return base_cardinal + suffix
+
+
+@lru_cache(maxsize=2048)
+def _english_ordinal_words_int(val: int) -> str:
+    """
+    Build English ordinal words for a positive integer in one pass:
+    the hundreds-and-above part is read as a cardinal and only the
+    sub-100 tail takes an ordinal form.
+    """
+    if val < 100:
+        return _ORD_WORDS_SUB_100[val]
+
+    tail = val % 100
+    if tail == 0:
+        cardinal = english.integer_to_words(val)
+        if cardinal.endswith("y"):
+            return cardinal[:-1] + "ieth"
+        return cardinal + "th"
+
+    base_words = english.integer_to_words(val - tail)
+    return f"{base_words} {_ORD_WORDS_SUB_100[tail]}"
 
 
 def to_english_ordinal_words(number: Union[str, int, float]) -> str:
@@ -140,26 +186,7 @@ def to_english_ordinal_words(number: Union[str, int, float]) -> str:
     except (ValueError, TypeError):
         raise ValueError("English ordinal words require a positive integer.")
 
-    if val in ENG_ORDINAL_WORDS:
-        return ENG_ORDINAL_WORDS[val]
-
-    if val < 100:
-        tens = (val // 10) * 10
-        ones = val % 10
-        return f"{ENG_NUMBER_WORDS[tens]}-{ENG_ORDINAL_WORDS[ones]}"
-
-    if val % 100 == 0:
-        cardinal = english.integer_to_words(val)
-        if cardinal.endswith("y"):
-            return cardinal[:-1] + "ieth"
-        return cardinal + "th"
-    else:
-        remainder = val % 100
-        base_val = val - remainder
-        base_words = english.integer_to_words(base_val)
-        ordinal_suffix_words = to_english_ordinal_words(remainder)
-
-        return f"{base_words} {ordinal_suffix_words}"
+    return _english_ordinal_words_int(val)
 
 
 def to_ordinal_words(value: Union[str, int, float], to_lang: str, **kwargs) -> str:
@@ -1,20 +1,21 @@
 import random
-from typing import Any, List, Sequence, Union
+from collections.abc import Sequence as _SequenceABC
+from functools import partial
+from typing import Any, Callable, List, Sequence, Union
 
 from . import cardinal_converter, digit_formatter
 from . import internal_utils as util
 
 
-def _apply_odia_formatting(
-    value: Union[int, float],
+def _resolve_formatter(
     *,
     as_words: bool = False,
     as_digits: bool = True,
     barnabodha_style: bool = False,
     **kwargs,
-) -> Any:
+) -> Callable[[Union[int, float]], Any]:
     """
-    Format a numeric value into Odia representation.
+    Choose the Odia formatter for numeric values once from the flags.
 
     Priority order:
     1. Odia words (standard or Barnabodha style)
@@ -22,26 +23,50 @@ def _apply_odia_formatting(
     3. Raw numeric value
 
     Args:
-        value (int | float): Number to format.
         as_words (bool): Convert to Odia words.
         as_digits (bool): Convert to Odia digits (default).
         barnabodha_style (bool): Use Barnabodha word style.
 
     Returns:
-        Any: Formatted value in Odia or raw number.
+        Callable[[int | float], Any]: Formatter to apply to each value.
     """
 
     if as_words:
-        return (
-            cardinal_converter.to_barnabodha_words(value, **kwargs)
+        convert = (
+            cardinal_converter.to_barnabodha_words
             if barnabodha_style
-            else cardinal_converter.to_odia_words(value, **kwargs)
+            else cardinal_converter.to_odia_words
         )
+        return partial(convert, **kwargs) if kwargs else convert
     if as_digits:
-        return digit_formatter.to_odia_digits(value)
+        return digit_formatter.to_odia_digits
+    return _identity
+
+
+def _identity(value: Union[int, float]) -> Union[int, float]:
+    """Return the raw numeric value unchanged."""
     return value
 
 
+def _as_sequence(items: Any) -> Sequence:
+    """Return ``items`` as a sequence, materializing sets, dicts and iterators."""
+    return items if isinstance(items, _SequenceABC) else list(items)
+
+
+def _apply_odia_formatting(value: Union[int, float], **kwargs) -> Any:
+    """
+    Format a single numeric value into Odia representation.
+
+    Args:
+        value (int | float): Number to format.
+        **kwargs: Formatting flags, see ``_resolve_formatter``.
+
+    Returns:
+        Any: Formatted value in Odia or raw number.
+    """
+    return _resolve_formatter(**kwargs)(value)
+
+
 def get_random_int(start: Any, end: Any, **kwargs) -> Any:
     """Generates a random integer between start and end (inclusive).
     Supports '`as_words=True`'.
@@ -152,8 +177,10 @@ def pick_one(items: Sequence, **kwargs) -> Any:
     Returns:
         Any: Converts Odia numeric strings found in items
     """
-    processed_items = [util._to_english_numeric(i) for i in items]
-    choice = random.choice(processed_items)
+    # Only the picked item needs Odia numeric strings converted
+    choice = random.choice(_as_sequence(items))
+    if isinstance(choice, str):
+        choice = util._to_english_numeric(choice)
 
     if isinstance(choice, (int, float)):
         return _apply_odia_formatting(choice, **kwargs)
@@ -174,13 +201,14 @@ def pick_multiple(items: Sequence, count: Any = 1, **kwargs) -> List[Any]:
                    optionally formatted.
     """
     k_val = int(util._to_english_numeric(count))
-    processed_items = [util._to_english_numeric(i) for i in items]
+    to_numeric = util._to_english_numeric
 
-    results = random.choices(processed_items, k=k_val)
-    return [
-        _apply_odia_formatting(v, **kwargs) if isinstance(v, (int, float)) else v
-        for v in results
+    results = [
+        to_numeric(i) if isinstance(i, str) else i
+        for i in random.choices(_as_sequence(items), k=k_val)
     ]
+    fmt = _resolve_formatter(**kwargs)
+    return [fmt(v) if isinstance(v, (int, float)) else v for v in results]
 
 
 def pick_unique_sample(items: Sequence, count: Any, **kwargs) -> List[Any]:
@@ -200,11 +228,14 @@ def pick_unique_sample(items: Sequence, count: Any, **kwargs) -> List[Any]:
                    optionally formatted.
     """
     k_val = int(util._to_english_numeric(count))
-    processed_items = [util._to_english_numeric(i) for i in items]
-    if k_val > len(processed_items):
+    items = _as_sequence(items)
+    if k_val > len(items):
         raise ValueError("count cannot exceed the number of available items")
-    results = random.sample(processed_items, k=k_val)
-    return [
-        _apply_odia_formatting(v, **kwargs) if isinstance(v, (int, float)) else v
-        for v in results
+
+    to_numeric = util._to_english_numeric
+    results = [
+        to_numeric(i) if isinstance(i, str) else i
+        for i in random.sample(items, k=k_val)
     ]
+    fmt = _resolve_formatter(**kwargs)
+    return [fmt(v) if isinstance(v, (int, float)) else v for v in results]
@@ -2,7 +2,13 @@ from typing import Union
 
 from . import internal_utils as util
 from .cardinal_converter import to_odia_words
-from .constants import DASHAMIK, FRACTIONS, NUM_DATA
+from .constants import DASHAMIK, FRACTIONS, NUM_WORDS
+
+# Per-language word for every character of a validated number string
+_READING_WORDS = tuple(
+    {**{str(digit): NUM_WORDS[idx][digit] for digit in range(10)}, ".": DASHAMIK[idx]}
+    for idx in range(3)
+)
 
 
 def to_fraction_words(
@@ -60,11 +66,5 @@ def to_reading_sequence(
     num_str = util._validate_and_format(num_val)
     index = util._resolve_language_index(as_roman, as_odilish)
 
-    words = []
-    for char in num_str:
-        if char == ".":
-            words.append(DASHAMIK[index])
-        else:
-            words.append(NUM_DATA[int(char)][index])
-
-    return " ".join(words)
+    words = _READING_WORDS[index]
+    return " ".join([words[char] for char in num_str])
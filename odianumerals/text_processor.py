@@ -1,11 +1,14 @@
 import re
 from typing import List, Union
 
-from .digit_formatter import to_english_number, to_odia_digits
+from .constants import ODIA_DIGIT_TRANS
+from .digit_formatter import to_english_number
 
 ODIA_NUM_PATTERN = r"[୦-୯][୦-୯,.]*[୦-୯]|[୦-୯]"
 ENG_NUM_PATTERN = r"[0-9][0-9,.]*[0-9]|[0-9]"
 
+_ODIA_RE = re.compile(ODIA_NUM_PATTERN)
+
 
 def extract_odia_numbers(
     text: str, as_english: bool = False
@@ -20,7 +23,7 @@ def extract_odia_numbers(
     Returns:
         A list of identified numbers.
     """
-    matches = re.findall(ODIA_NUM_PATTERN, text)
+    matches = _ODIA_RE.findall(text)
 
     if not as_english:
         return matches
@@ -42,11 +45,6 @@ def _odia_to_eng_callback(match):
         return token
 
 
-def _eng_to_odia_callback(match):
-    token = match.group()
-    return to_odia_digits(token)
-
-
 def replace_numbers(text: str, to_english: bool = False) -> str:
     """
     Swaps numbers in a string between Odia and English scripts.
@@ -58,6 +56,7 @@ def replace_numbers(text: str, to_english: bool = False) -> str:
     """
 
     if to_english:
-        return re.sub(ODIA_NUM_PATTERN, _odia_to_eng_callback, text)
+        return _ODIA_RE.sub(_odia_to_eng_callback, text)
     else:
-        return re.sub(ENG_NUM_PATTERN, _eng_to_odia_callback, text)
+        # English -> Odia is a pure digit swap, so translate the whole text
+        return text.translate(ODIA_DIGIT_TRANS)
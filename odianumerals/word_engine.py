@@ -0,0 +1,99 @@
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
+
+from .constants import DASHAMIK, NUM_WORDS
+
+# Words for single digits 0-9 per language index (fractional parts)
+_DIGIT_WORDS = tuple(words[:10] for words in NUM_WORDS)
+
+
+def build_int_converter(
+    units: Dict[int, Tuple[str, str, str]],
+) -> Callable[[int, int], str]:
+    """
+    Build a memoized integer-to-words converter for a denomination table
+    such as ``UNITS`` or ``BARNABODHA_UNITS``.
+
+    The unit table is specialized once here: unit values are kept as an
+    ascending tuple for ``bisect`` and the labels as one ordered tuple of
+    ``(unit, label)`` pairs per language index, largest first.
+
+    Args:
+        units (Dict[int, Tuple[str, str, str]]): Unit value -> labels per index
+
+    Returns:
+        Callable[[int, int], str]: Converter taking ``(value, index)``
+    """
+    unit_keys = tuple(sorted(units))
+    unit_tables = tuple(
+        tuple((unit, units[unit][index]) for unit in reversed(unit_keys))
+        for index in range(3)
+    )
+
+    @lru_cache(maxsize=4096)
+    def convert(
+        value: int,
+        index: int,
+        _words=NUM_WORDS,
+        _tables=unit_tables,
+        _keys=unit_keys,
+        _divmod=divmod,
+    ) -> str:
+        """
+        Convert a non-negative integer to Odia words for a resolved
+        language index. Results are memoized per ``(value, index)``.
+
+        Denominations are walked from the largest applicable unit down,
+        emitting ``quotient unit`` pairs until the remainder fits the
+        0-100 table. The underscored keyword defaults bind lookups as
+        locals and are not meant to be passed by callers.
+        """
+        words = _words[index]
+        if value <= 100:
+            return words[value]
+
+        # Jump straight to the largest unit not exceeding the value
+        start = len(_keys) - bisect_right(_keys, value)
+
+        parts = []
+        for unit, label in _tables[index][start:]:
+            if value >= unit:
+                quotient, value = _divmod(value, unit)
+                # Only the largest unit can leave a quotient above 100
+                parts.append(
+                    words[quotient] if quotient <= 100 else convert(quotient, index)
+                )
+                parts.append(label)
+                if value <= 100:
+                    break
+
+        if value:
+            parts.append(words[value])
+
+        return " ".join(parts)
+
+    return convert
+
+
+def decimal_to_words(
+    num_str: str, index: int, int_converter: Callable[[int, int], str]
+) -> str:
+    """
+    Convert an already validated decimal string (e.g. ``"10.5"``) to
+    Odia words, reading the fractional part digit by digit.
+
+    Args:
+        num_str (str): Validated decimal string
+        index (int): Language index
+        int_converter (Callable[[int, int], str]): Converter for the integer part
+
+    Returns:
+        str: Odia number in words
+    """
+    integer_part, _, fractional_part = num_str.partition(".")
+    digit_words = _DIGIT_WORDS[index]
+    parts = [int_converter(int(integer_part), index), DASHAMIK[index]]
+    # Validated strings hold ASCII digits only, so ord() - 48 is the digit
+    parts.extend([digit_words[ord(digit) - 48] for digit in fractional_part])
+    return " ".join(parts)